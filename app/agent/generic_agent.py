@@ -6,6 +6,7 @@ This implementation uses the new OpenAI API format.
 import asyncio
 import json
 import logging
+import re
 from typing import Dict, List, Any, Optional, Union
 
 from openai import OpenAI
@@ -17,6 +18,29 @@ from app.tool.collection import ToolCollection
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Matches a "use tool: <name> [arguments]" directive in an execution plan
+TOOL_DIRECTIVE_PATTERN = re.compile(r"use tool:[ \t]*(\S+)(?:[ \t]+(.*))?", re.IGNORECASE)
+
+
+def extract_text_from_response(response) -> str:
+    """
+    Extract text from an OpenAI API response.
+    
+    Args:
+        response: The OpenAI API response
+        
+    Returns:
+        The extracted text as a string
+    """
+    text = ""
+    if response.output and len(response.output) > 0:
+        for output_item in response.output:
+            if hasattr(output_item, 'content') and output_item.content:
+                for content_item in output_item.content:
+                    if hasattr(content_item, 'text') and content_item.text:
+                        text += content_item.text
+    return text
+
 
 class GenericAgent(BaseModel):
     """
@@ -71,9 +95,12 @@ class GenericAgent(BaseModel):
     class Config:
         arbitrary_types_allowed = True
     
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._client = OpenAI()
+    @property
+    def client(self) -> OpenAI:
+        """OpenAI client, created on first use."""
+        if self._client is None:
+            self._client = OpenAI()
+        return self._client
     
     async def set_goal(self, goal: str) -> None:
         """
@@ -95,25 +122,6 @@ class GenericAgent(BaseModel):
         """
         self.memory.append({"role": role, "content": content})
         
-    def _extract_text_from_response(self, response) -> str:
-        """
-        Extract text from an OpenAI API response.
-        
-        Args:
-            response: The OpenAI API response
-            
-        Returns:
-            The extracted text as a string
-        """
-        text = ""
-        if response.output and len(response.output) > 0:
-            for output_item in response.output:
-                if hasattr(output_item, 'content') and output_item.content:
-                    for content_item in output_item.content:
-                        if hasattr(content_item, 'text') and content_item.text:
-                            text += content_item.text
-        return text
-    
     async def run(self, goal: Optional[str] = None) -> str:
         """
         Run the agent to achieve the specified goal.
@@ -147,7 +155,7 @@ class GenericAgent(BaseModel):
         self.update_memory("system", "Plan by working backwards from the goal. What is the final step needed to achieve the goal?")
         
         # Use the new OpenAI API format for planning
-        response = self._client.responses.create(
+        response = self.client.responses.create(
             model="gpt-4o",
             input=[
                 {
@@ -173,7 +181,7 @@ class GenericAgent(BaseModel):
         )
         
         # Extract the response text using helper method
-        final_step_description = self._extract_text_from_response(response)
+        final_step_description = extract_text_from_response(response)
         
         # Add the final step to the backwards steps
         final_step = {
@@ -193,7 +201,7 @@ class GenericAgent(BaseModel):
             self.update_memory("system", step_query)
             
             # Use the new OpenAI API format for step-back questioning
-            response = self._client.responses.create(
+            response = self.client.responses.create(
                 model="gpt-4o",
                 input=[
                     {
@@ -219,10 +227,10 @@ class GenericAgent(BaseModel):
             )
             
             # Extract the response text using helper method
-            previous_step_description = self._extract_text_from_response(response)
+            previous_step_description = extract_text_from_response(response)
             
             # Check if we've reached the initial state
-            if "initial state" in previous_step_description.lower() or "already at initial state" in previous_step_description.lower():
+            if "initial state" in previous_step_description.lower():
                 break
             
             # Add the previous step to the backwards steps
@@ -284,7 +292,7 @@ class GenericAgent(BaseModel):
             tools_to_use = [tool.name for tool in self.available_tools.tools]
         
         # Use the new OpenAI API format for step execution
-        response = self._client.responses.create(
+        response = self.client.responses.create(
             model="gpt-4o",
             input=[
                 {
@@ -310,36 +318,33 @@ class GenericAgent(BaseModel):
         )
         
         # Extract the response text using helper method
-        execution_plan = self._extract_text_from_response(response)
+        execution_plan = extract_text_from_response(response)
         
         # Determine if we need to use a tool
         tool_to_use = None
         tool_args = {}
         
-        # Parse the execution plan to identify tool usage
-        if "use tool:" in execution_plan.lower():
+        # Parse the execution plan to identify tool usage (first directive wins)
+        match = TOOL_DIRECTIVE_PATTERN.search(execution_plan)
+        if match:
             # Extract tool name and arguments
-            tool_lines = [line for line in execution_plan.split('\n') if "use tool:" in line.lower()]
-            if tool_lines:
-                tool_line = tool_lines[0]
-                tool_parts = tool_line.split("use tool:", 1)[1].strip().split(" ", 1)
-                tool_name = tool_parts[0].strip()
-                
-                # Find the tool in the available tools
-                if self.available_tools:
-                    for tool in self.available_tools.tools:
-                        if tool.name.lower() == tool_name.lower():
-                            tool_to_use = tool
-                            
-                            # Extract arguments if provided
-                            if len(tool_parts) > 1:
-                                try:
-                                    # Try to parse as JSON
-                                    tool_args = json.loads(tool_parts[1])
-                                except json.JSONDecodeError:
-                                    # If not JSON, use as a single argument
-                                    tool_args = {"input": tool_parts[1].strip()}
-                            break
+            tool_name, raw_args = match.group(1), match.group(2)
+            
+            # Find the tool in the available tools
+            if self.available_tools:
+                for tool in self.available_tools.tools:
+                    if tool.name.lower() == tool_name.lower():
+                        tool_to_use = tool
+                        
+                        # Extract arguments if provided
+                        if raw_args:
+                            try:
+                                # Try to parse as JSON
+                                tool_args = json.loads(raw_args)
+                            except json.JSONDecodeError:
+                                # If not JSON, use as a single argument
+                                tool_args = {"input": raw_args.strip()}
+                        break
         
         # Execute the tool if needed
         if tool_to_use:
@@ -368,7 +373,7 @@ class GenericAgent(BaseModel):
             A summary of the execution
         """
         # Use the new OpenAI API format for summary generation
-        response = self._client.responses.create(
+        response = self.client.responses.create(
             model="gpt-4o",
             input=[
                 {
@@ -394,7 +399,7 @@ class GenericAgent(BaseModel):
         )
         
         # Extract the response text using helper method
-        summary = self._extract_text_from_response(response)
+        summary = extract_text_from_response(response)
         
         return summary
     
@@ -10,14 +10,11 @@ import json
 from typing import Dict, List, Optional, Any, Tuple, Union
 
 from openai import OpenAI
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
-from langchain.schema import BaseMessage, HumanMessage, AIMessage, SystemMessage
-from langchain.chat_models import ChatOpenAI
+from langchain.schema import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
 from app.agent.base import BaseAgent
-from app.agent.generic_agent import GenericAgent
+from app.agent.generic_agent import GenericAgent, extract_text_from_response
 from app.agent.langchain_agent import LangChainAgent, AgentProfile, ConversationState
 from app.logger import logger
 from app.schema.message import Message
@@ -42,6 +39,38 @@ class AgentRole(BaseModel):
         )
 
 
+# Roles used when a HybridAgent is created without explicit roles.
+# Built once at import time; each agent gets its own deep copies.
+DEFAULT_ROLES: List[AgentRole] = [
+    AgentRole(
+        name="Planner",
+        description="Strategic Planner",
+        expertise=["project management", "task decomposition", "risk assessment"],
+        system_prompt="""You are a Strategic Planner who excels at breaking down complex problems into manageable steps.
+                    Your expertise is in project management, task decomposition, and risk assessment.
+                    In conversations, focus on creating structured plans, identifying dependencies between tasks,
+                    and ensuring all aspects of a problem are addressed systematically."""
+    ),
+    AgentRole(
+        name="Developer",
+        description="Software Developer",
+        expertise=["coding", "software architecture", "debugging"],
+        system_prompt="""You are a Software Developer with deep expertise in coding, software architecture, and debugging.
+                    In conversations, focus on implementation details, code structure, and technical feasibility.
+                    Provide concrete examples and suggest practical solutions to technical challenges."""
+    ),
+    AgentRole(
+        name="Critic",
+        description="Quality Assurance Specialist",
+        expertise=["testing", "edge cases", "user experience"],
+        system_prompt="""You are a Quality Assurance Specialist who excels at identifying potential issues and edge cases.
+                    Your expertise is in testing, finding edge cases, and evaluating user experience.
+                    In conversations, focus on what might go wrong, how to test solutions thoroughly,
+                    and how to ensure a good user experience."""
+    )
+]
+
+
 class HybridAgent(BaseAgent):
     """
     A hybrid agent that combines the Working Backwards methodology from GenericAgent
@@ -91,7 +120,6 @@ class HybridAgent(BaseAgent):
     def __init__(self, **data):
         """Initialize the hybrid agent."""
         super().__init__(**data)
-        self._client = OpenAI()
         
         # Initialize the planning agent
         self._initialize_planning_agent()
@@ -99,6 +127,13 @@ class HybridAgent(BaseAgent):
         # Initialize the execution agents
         self._initialize_execution_agents()
     
+    @property
+    def client(self) -> OpenAI:
+        """OpenAI client, created on first use."""
+        if self._client is None:
+            self._client = OpenAI()
+        return self._client
+    
     def _initialize_planning_agent(self) -> None:
         """Initialize the planning agent using GenericAgent."""
         self.planning_agent = GenericAgent(
@@ -110,36 +145,9 @@ class HybridAgent(BaseAgent):
     
     def _initialize_execution_agents(self) -> None:
         """Initialize the execution agents using LangChainAgent."""
-        # Create default roles if none are provided
+        # Use the default roles if none are provided
         if not self.roles:
-            self.roles = [
-                AgentRole(
-                    name="Planner",
-                    description="Strategic Planner",
-                    expertise=["project management", "task decomposition", "risk assessment"],
-                    system_prompt="""You are a Strategic Planner who excels at breaking down complex problems into manageable steps.
-                    Your expertise is in project management, task decomposition, and risk assessment.
-                    In conversations, focus on creating structured plans, identifying dependencies between tasks,
-                    and ensuring all aspects of a problem are addressed systematically."""
-                ),
-                AgentRole(
-                    name="Developer",
-                    description="Software Developer",
-                    expertise=["coding", "software architecture", "debugging"],
-                    system_prompt="""You are a Software Developer with deep expertise in coding, software architecture, and debugging.
-                    In conversations, focus on implementation details, code structure, and technical feasibility.
-                    Provide concrete examples and suggest practical solutions to technical challenges."""
-                ),
-                AgentRole(
-                    name="Critic",
-                    description="Quality Assurance Specialist",
-                    expertise=["testing", "edge cases", "user experience"],
-                    system_prompt="""You are a Quality Assurance Specialist who excels at identifying potential issues and edge cases.
-                    Your expertise is in testing, finding edge cases, and evaluating user experience.
-                    In conversations, focus on what might go wrong, how to test solutions thoroughly,
-                    and how to ensure a good user experience."""
-                )
-            ]
+            self.roles = [role.model_copy(deep=True) for role in DEFAULT_ROLES]
         
         # Create an execution agent for each role
         for role in self.roles:
@@ -165,25 +173,6 @@ class HybridAgent(BaseAgent):
         # Add the goal to the conversation
         self.conversation.add_message(SystemMessage(content=f"Goal: {goal}"))
     
-    def _extract_text_from_response(self, response) -> str:
-        """
-        Extract text from an OpenAI API response.
-        
-        Args:
-            response: The OpenAI API response
-            
-        Returns:
-            The extracted text as a string
-        """
-        text = ""
-        if response.output and len(response.output) > 0:
-            for output_item in response.output:
-                if hasattr(output_item, 'content') and output_item.content:
-                    for content_item in output_item.content:
-                        if hasattr(content_item, 'text') and content_item.text:
-                            text += content_item.text
-        return text
-    
     async def run(self, goal: Optional[str] = None) -> str:
         """
         Run the agent to achieve the specified goal.
@@ -207,15 +196,8 @@ class HybridAgent(BaseAgent):
         # Add the plan to the conversation
         self.conversation.add_message(SystemMessage(content=f"Plan: {plan_result}"))
         
-        # Get the execution status from the planning agent
-        plan_status = await self.planning_agent.get_execution_status()
-        
-        # Extract the steps from the plan status
-        steps = []
-        for line in plan_status.split("\n"):
-            if line.startswith("✅ Step ") or line.startswith("🔄 Step ") or line.startswith("⏳ Step "):
-                step_description = line.split(":", 1)[1].strip()
-                steps.append(step_description)
+        # Take the steps straight from the planning agent's forward plan
+        steps = [step["description"].strip() for step in self.planning_agent.forward_plan]
         
         # Start the multi-agent conversation to execute the plan
         logger.info("Starting multi-agent conversation to execute the plan")
@@ -239,12 +221,16 @@ class HybridAgent(BaseAgent):
         # Initialize the conversation log
         conversation_log = [("system", initial_message)]
         
+        # Speaking order is fixed for the whole conversation
+        agent_names = list(self.execution_agents.keys())
+        
         # Determine the first agent to respond (start with the Planner)
-        current_agent_name = "Planner" if "Planner" in self.execution_agents else next(iter(self.execution_agents.keys()))
+        current_idx = agent_names.index("Planner") if "Planner" in self.execution_agents else 0
         
         # Run the conversation for max_steps
         for _ in range(self.max_steps):
             # Get the current agent
+            current_agent_name = agent_names[current_idx]
             current_agent = self.execution_agents[current_agent_name]
             
             # Have the agent think and respond
@@ -260,10 +246,7 @@ class HybridAgent(BaseAgent):
                     await agent.receive_message(response, current_agent_name)
             
             # Select the next agent (simple round-robin for now)
-            agent_names = list(self.execution_agents.keys())
-            current_idx = agent_names.index(current_agent_name)
-            next_idx = (current_idx + 1) % len(agent_names)
-            current_agent_name = agent_names[next_idx]
+            current_idx = (current_idx + 1) % len(agent_names)
         
         # Generate a summary of the execution
         summary = await self._generate_summary(conversation_log)
@@ -284,7 +267,7 @@ class HybridAgent(BaseAgent):
         formatted_log = "\n\n".join([f"{speaker}: {message}" for speaker, message in conversation_log])
         
         # Use the OpenAI API to generate a summary
-        response = self._client.responses.create(
+        response = self.client.responses.create(
             model="gpt-4o",
             input=[
                 {
@@ -310,7 +293,7 @@ class HybridAgent(BaseAgent):
         )
         
         # Extract the response text
-        summary = self._extract_text_from_response(response)
+        summary = extract_text_from_response(response)
         
         return summary
     
@@ -7,6 +7,7 @@ rally and advance their thinking process together.
 """
 
 import asyncio
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 
 from langchain.chains import LLMChain
@@ -20,6 +21,24 @@ from app.logger import logger
 from app.schema.message import Message
 
 
+# Variables shared by the thinking and response prompt templates
+PROMPT_INPUT_VARIABLES = ["agent_name", "agent_role", "agent_expertise", "conversation_history"]
+
+
+@lru_cache(maxsize=8)
+def _build_prompt_template(template: str) -> PromptTemplate:
+    """
+    Build a PromptTemplate for the given template string.
+    
+    Templates are parsed once and shared by every agent using the same
+    template string, instead of being rebuilt for each agent instance.
+    """
+    return PromptTemplate(
+        input_variables=PROMPT_INPUT_VARIABLES,
+        template=template
+    )
+
+
 class AgentProfile(BaseModel):
     """Profile for an agent in the multi-agent conversation system."""
     
@@ -46,9 +65,7 @@ class ConversationState(BaseModel):
     
     def add_thinking(self, agent_name: str, thought: str) -> None:
         """Add a thought to an agent's thinking process."""
-        if agent_name not in self.thinking_process:
-            self.thinking_process[agent_name] = []
-        self.thinking_process[agent_name].append(thought)
+        self.thinking_process.setdefault(agent_name, []).append(thought)
     
     def get_formatted_history(self, include_system: bool = False) -> str:
         """Get the formatted conversation history."""
@@ -66,12 +83,13 @@ class ConversationState(BaseModel):
     
     def get_thinking_process(self, agent_name: str) -> str:
         """Get the thinking process for a specific agent."""
-        if agent_name not in self.thinking_process:
+        thoughts = self.thinking_process.get(agent_name)
+        if not thoughts:
             return "No thoughts recorded yet."
         
         return "\n".join([
             f"Thought {i+1}: {thought}" 
-            for i, thought in enumerate(self.thinking_process[agent_name])
+            for i, thought in enumerate(thoughts)
         ])
 
 
@@ -135,17 +153,11 @@ class LangChainAgent(BaseAgent):
         llm = ChatOpenAI(temperature=0.7)
         
         # Create the response chain
-        response_prompt = PromptTemplate(
-            input_variables=["agent_name", "agent_role", "agent_expertise", "conversation_history"],
-            template=self.response_template
-        )
+        response_prompt = _build_prompt_template(self.response_template)
         self.llm_chain = LLMChain(llm=llm, prompt=response_prompt)
         
         # Create the thinking chain
-        thinking_prompt = PromptTemplate(
-            input_variables=["agent_name", "agent_role", "agent_expertise", "conversation_history"],
-            template=self.thinking_template
-        )
+        thinking_prompt = _build_prompt_template(self.thinking_template)
         self.thinking_chain = LLMChain(llm=llm, prompt=thinking_prompt)
     
     async def think(self) -> bool:
@@ -292,12 +304,16 @@ class MultiAgentConversation(BaseModel):
         # Initialize the conversation log
         conversation_log = [("human", initial_message)]
         
+        # Speaking order is fixed for the whole conversation
+        agent_names = list(self.agents.keys())
+        
         # Determine the first agent to respond (can be random or fixed)
-        current_agent_name = next(iter(self.agents.keys()))
+        current_idx = 0
         
         # Run the conversation for max_turns
         for _ in range(self.max_turns):
             # Get the current agent
+            current_agent_name = agent_names[current_idx]
             current_agent = self.agents[current_agent_name]
             
             # Have the agent think and respond
@@ -313,10 +329,7 @@ class MultiAgentConversation(BaseModel):
                     await agent.receive_message(response, current_agent_name)
             
             # Select the next agent (simple round-robin for now)
-            agent_names = list(self.agents.keys())
-            current_idx = agent_names.index(current_agent_name)
-            next_idx = (current_idx + 1) % len(agent_names)
-            current_agent_name = agent_names[next_idx]
+            current_idx = (current_idx + 1) % len(agent_names)
         
         return conversation_log
     
@@ -0,0 +1,10 @@
+"""
+Utilities shared by the XinobiAgent demos and examples.
+"""
+
+from app.utils.console import BANNER, print_header
+
+__all__ = [
+    "BANNER",
+    "print_header"
+]
@@ -0,0 +1,16 @@
+"""
+Console output helpers for the XinobiAgent demos.
+"""
+
+# Separator line printed around demo section headers
+BANNER = "◤◢" * 14
+
+
+def print_header(*lines: str) -> None:
+    """
+    Print a section header framed by banner lines with a single print call.
+    
+    Args:
+        *lines: Lines to print between the banners
+    """
+    print(f"\n{BANNER}\n" + "\n".join(lines) + f"\n{BANNER}\n")
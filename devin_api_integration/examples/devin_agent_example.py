@@ -5,18 +5,30 @@ Example usage of the DevinAgent with the Devin API.
 import os
 import asyncio
 import logging
+import tempfile
 from typing import Dict, Any
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import the DevinAgent
 from devin_api_integration.src.devin_agent import DevinAgent
 
-async def run_simple_task_example():
+# Contents of the file uploaded by the file upload example
+EXAMPLE_CONTEXT_FILE = b"""
+# Example Python file
+def hello_world():
+    print("Hello, world!")
+
+if __name__ == "__main__":
+    hello_world()
+"""
+
+async def run_simple_task_example(api_key: str):
     """
     Run a simple task using the DevinAgent.
+    
+    Args:
+        api_key: Devin API key.
     """
     print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
     print("Devin API Example: Simple Task")
@@ -26,7 +38,7 @@ async def run_simple_task_example():
     agent = DevinAgent(
         name="example_agent",
         description="Example agent for demonstrating Devin API integration",
-        api_key=os.environ.get("DEVIN_API_KEY")
+        api_key=api_key
     )
     
     # Create a task
@@ -56,10 +68,15 @@ async def run_simple_task_example():
     except Exception as e:
         logger.error(f"Error running task: {str(e)}")
         print(f"Error: {str(e)}")
+    finally:
+        agent.client.close()
 
-async def run_xinobi_template_example():
+async def run_xinobi_template_example(api_key: str):
     """
     Run a task using a XinobiAgent template.
+    
+    Args:
+        api_key: Devin API key.
     """
     print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
     print("Devin API Example: XinobiAgent Template")
@@ -69,7 +86,7 @@ async def run_xinobi_template_example():
     agent = DevinAgent(
         name="xinobi_agent",
         description="Agent for demonstrating XinobiAgent template integration",
-        api_key=os.environ.get("DEVIN_API_KEY")
+        api_key=api_key
     )
     
     # Create a template
@@ -106,10 +123,15 @@ async def run_xinobi_template_example():
     except Exception as e:
         logger.error(f"Error running task: {str(e)}")
         print(f"Error: {str(e)}")
+    finally:
+        agent.client.close()
 
-async def run_file_upload_example():
+async def run_file_upload_example(api_key: str):
     """
     Run an example that uploads a file to provide context.
+    
+    Args:
+        api_key: Devin API key.
     """
     print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
     print("Devin API Example: File Upload")
@@ -119,21 +141,12 @@ async def run_file_upload_example():
     agent = DevinAgent(
         name="file_upload_agent",
         description="Agent for demonstrating file upload",
-        api_key=os.environ.get("DEVIN_API_KEY")
+        api_key=api_key
     )
     
     # Create a temporary file
-    import tempfile
-    
     with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as temp:
-        temp.write(b"""
-# Example Python file
-def hello_world():
-    print("Hello, world!")
-
-if __name__ == "__main__":
-    hello_world()
-""")
+        temp.write(EXAMPLE_CONTEXT_FILE)
         temp_file_path = temp.name
     
     try:
@@ -160,21 +173,24 @@ if __name__ == "__main__":
     finally:
         # Clean up the temporary file
         os.unlink(temp_file_path)
+        agent.client.close()
 
 async def main():
     """
     Run all examples.
     """
     # Check if API key is set
-    if not os.environ.get("DEVIN_API_KEY"):
+    api_key = os.environ.get("DEVIN_API_KEY")
+    if not api_key:
         print("Error: DEVIN_API_KEY environment variable not set")
         print("Please set the DEVIN_API_KEY environment variable to your Devin API key")
         return
     
     # Run the examples
-    await run_simple_task_example()
-    await run_xinobi_template_example()
-    await run_file_upload_example()
+    await run_simple_task_example(api_key)
+    await run_xinobi_template_example(api_key)
+    await run_file_upload_example(api_key)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
@@ -4,12 +4,12 @@ Gradio demo for Devin API integration.
 
 import os
 import sys
-import asyncio
-import gradio as gr
-from typing import Dict, Any, Optional, List, Tuple
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 
-# Add parent directory to path to import DevinAPIClient and DevinAgent
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+# Add the repository root to the path to import DevinAPIClient and DevinAgent
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
 from devin_api_integration.src.devin_api_client import DevinAPIClient
 from devin_api_integration.src.devin_agent import DevinAgent
 
@@ -71,7 +71,8 @@ async def create_agent(api_key: str, agent_name: str, agent_description: str) ->
     global agent
     
     try:
-        # Create the agent
+        # Create the agent. The replaced agent's client is not closed since a
+        # request may still be in flight on it; it is released when collected.
         agent = DevinAgent(
             name=agent_name,
             description=agent_description,
@@ -132,28 +133,35 @@ async def send_follow_up(message: str) -> Tuple[str, str]:
     except Exception as e:
         return f"メッセージ送信エラー: {str(e)} ❌", "error"
 
-async def get_session_status() -> Tuple[str, Dict[str, Any]]:
+async def get_session_status() -> AsyncIterator[Tuple[str, str]]:
     """
     Get the status of the current session.
     
-    Returns:
-        Status message and session details.
+    Yields a progress message first so the UI updates while the API
+    request is in flight, then the final result.
+    
+    Yields:
+        Status message and formatted session details (Markdown).
     """
     global agent, session_id
     
     if not agent:
-        return "APIキーを設定してエージェントを作成してください ⚠️", {}
+        yield "APIキーを設定してエージェントを作成してください ⚠️", ""
+        return
     
     if not session_id:
-        return "タスクを作成してください ⚠️", {}
+        yield "タスクを作成してください ⚠️", ""
+        return
+    
+    yield "セッションステータスを取得中... ⏳", ""
     
     try:
         # Get session details
         status = await agent.get_status()
         
-        return "セッションステータスを取得しました ✅", status
+        yield "セッションステータスを取得しました ✅", format_session_details(status)
     except Exception as e:
-        return f"ステータス取得エラー: {str(e)} ❌", {}
+        yield f"ステータス取得エラー: {str(e)} ❌", ""
 
 async def upload_file(file_path: str) -> Tuple[str, str]:
     """
@@ -178,6 +186,63 @@ async def upload_file(file_path: str) -> Tuple[str, str]:
     except Exception as e:
         return f"ファイルアップロードエラー: {str(e)} ❌", "error"
 
+async def upload_selected_file(file) -> str:
+    """
+    Upload the file selected in the UI, if any.
+    
+    Args:
+        file: Filepath (or file object) from the Gradio file component, or None.
+        
+    Returns:
+        Formatted status message.
+    """
+    if not file:
+        return format_status(("ファイルを選択してください ⚠️", "error"))
+    
+    return format_status(await upload_file(file if isinstance(file, str) else file.name))
+
+def format_status(status: Any) -> Any:
+    """
+    Format a status tuple for display.
+    
+    Args:
+        status: Status message and status type, or an already formatted value.
+        
+    Returns:
+        Status message styled by its status type.
+    """
+    if isinstance(status, tuple):
+        return f"<div class='status-{status[1]}'>{status[0]}</div>"
+    return status
+
+def format_info_status(status: Any) -> Any:
+    """
+    Format a status tuple for display using the informational style.
+    
+    Args:
+        status: Status message and payload, or an already formatted value.
+        
+    Returns:
+        Status message styled as information.
+    """
+    if isinstance(status, tuple):
+        return f"<div class='status-info'>{status[0]}</div>"
+    return status
+
+def format_details_status(details: Any) -> Any:
+    """
+    Format a session status tuple's details for display.
+    
+    Args:
+        details: Status message and session details, or an already formatted value.
+        
+    Returns:
+        Formatted session details.
+    """
+    if isinstance(details, tuple):
+        return format_session_details(details[1])
+    return details
+
 def format_session_details(details: Dict[str, Any]) -> str:
     """
     Format session details for display.
@@ -227,6 +292,9 @@ def create_ui():
     Returns:
         Gradio interface.
     """
+    # Imported here so the handlers can be used without loading Gradio
+    import gradio as gr
+    
     with gr.Blocks(css=css) as demo:
         gr.HTML("<h1 class='title'>Devin API デモ</h1>")
         gr.HTML("<p class='subtitle'>XinobiAgent フレームワークを使用した Devin API 統合のデモ</p>")
@@ -296,68 +364,68 @@ def create_ui():
         
         # Event handlers
         create_agent_btn.click(
-            fn=lambda api_key, name, desc: asyncio.run(create_agent(api_key, name, desc)),
+            fn=create_agent,
             inputs=[api_key_input, agent_name, agent_description],
             outputs=[agent_status]
         )
         
         create_task_btn.click(
-            fn=lambda prompt, playbook_id: asyncio.run(create_task(prompt, playbook_id)),
+            fn=create_task,
             inputs=[prompt_input, playbook_id],
             outputs=[task_status, session_id_display]
         )
         
         send_follow_up_btn.click(
-            fn=lambda message: asyncio.run(send_follow_up(message)),
+            fn=send_follow_up,
             inputs=[follow_up_input],
             outputs=[follow_up_status]
         )
         
         get_status_btn.click(
-            fn=lambda: asyncio.run(get_session_status()),
+            fn=get_session_status,
             inputs=[],
             outputs=[status_display, session_details]
         )
         
         upload_file_btn.click(
-            fn=lambda file: asyncio.run(upload_file(file.name)) if file else ("ファイルを選択してください ⚠️", "error"),
+            fn=upload_selected_file,
             inputs=[file_upload],
             outputs=[upload_status]
         )
         
         # Update status display format
         agent_status.change(
-            fn=lambda status: f"<div class='status-{status[1]}'>{status[0]}</div>" if isinstance(status, tuple) else status,
+            fn=format_status,
             inputs=[agent_status],
             outputs=[agent_status]
         )
         
         task_status.change(
-            fn=lambda status: f"<div class='status-{status[1]}'>{status[0]}</div>" if isinstance(status, tuple) else status,
+            fn=format_status,
             inputs=[task_status],
             outputs=[task_status]
         )
         
         follow_up_status.change(
-            fn=lambda status: f"<div class='status-{status[1]}'>{status[0]}</div>" if isinstance(status, tuple) else status,
+            fn=format_status,
             inputs=[follow_up_status],
             outputs=[follow_up_status]
         )
         
         status_display.change(
-            fn=lambda status: f"<div class='status-info'>{status[0]}</div>" if isinstance(status, tuple) else status,
+            fn=format_info_status,
             inputs=[status_display],
             outputs=[status_display]
         )
         
         session_details.change(
-            fn=lambda details: format_session_details(details[1]) if isinstance(details, tuple) else details,
+            fn=format_details_status,
             inputs=[session_details],
             outputs=[session_details]
         )
         
         upload_status.change(
-            fn=lambda status: f"<div class='status-{status[1]}'>{status[0]}</div>" if isinstance(status, tuple) else status,
+            fn=format_status,
             inputs=[upload_status],
             outputs=[upload_status]
         )
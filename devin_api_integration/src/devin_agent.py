@@ -13,6 +13,19 @@ from devin_api_integration.src.devin_api_client import DevinAPIClient
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Prompt layout used for tasks built from XinobiAgent templates
+XINOBI_PROMPT_TEMPLATE = """◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢
+User Input:
+
+{user_input}
+
+Goals:
+{goals}
+
+Tasks:
+{tasks}
+◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢"""
+
 
 class DevinAgent(BaseModel):
     """
@@ -70,8 +83,8 @@ class DevinAgent(BaseModel):
         # Use the provided playbook ID or the default one
         playbook_id = playbook_id or self.playbook_id
         
-        # Create a new session
-        response = self.client.create_session(prompt, playbook_id)
+        # Create a new session (the client is blocking, so run it off the event loop)
+        response = await asyncio.to_thread(self.client.create_session, prompt, playbook_id)
         
         # Store the session ID
         session_id = response.get("session_id")
@@ -86,6 +99,16 @@ class DevinAgent(BaseModel):
         assert self.session_id is not None, "Session ID should not be None at this point"
         return self.session_id
     
+    def _require_session(self) -> None:
+        """
+        Ensure a session is active.
+        
+        Raises:
+            ValueError: If no session is active.
+        """
+        if not self.session_id:
+            raise ValueError("No active session. Create a task first.")
+    
     async def send_follow_up(self, message: str) -> bool:
         """
         Send a follow-up message to Devin.
@@ -100,11 +123,10 @@ class DevinAgent(BaseModel):
             ValueError: If no session is active.
             requests.exceptions.RequestException: If the request fails.
         """
-        if not self.session_id:
-            raise ValueError("No active session. Create a task first.")
+        self._require_session()
         
         # Send the message
-        response = self.client.send_message(self.session_id, message)
+        response = await asyncio.to_thread(self.client.send_message, self.session_id, message)
         
         logger.info(f"Sent follow-up message to session {self.session_id}")
         
@@ -121,11 +143,10 @@ class DevinAgent(BaseModel):
             ValueError: If no session is active.
             requests.exceptions.RequestException: If the request fails.
         """
-        if not self.session_id:
-            raise ValueError("No active session. Create a task first.")
+        self._require_session()
         
         # Get session details
-        response = self.client.get_session(self.session_id)
+        response = await asyncio.to_thread(self.client.get_session, self.session_id)
         
         return response
     
@@ -145,7 +166,7 @@ class DevinAgent(BaseModel):
             ValueError: If attachment ID is not found in response.
         """
         # Upload the file
-        response = self.client.upload_file(file_path)
+        response = await asyncio.to_thread(self.client.upload_file, file_path)
         
         attachment_id = response.get("attachment_id")
         if not attachment_id:
@@ -177,21 +198,11 @@ class DevinAgent(BaseModel):
         tasks_str = "\n".join([f"- {task}" for task in tasks])
         
         # Format the prompt
-        prompt = f"""
-◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢
-User Input:
-
-{user_input}
-
-Goals:
-{goals_str}
-
-Tasks:
-{tasks_str}
-◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢
-"""
-        
-        return prompt.strip()
+        return XINOBI_PROMPT_TEMPLATE.format(
+            user_input=user_input,
+            goals=goals_str,
+            tasks=tasks_str
+        )
     
     async def run_task_from_xinobi_template(self, template_data: Dict[str, Any], playbook_id: Optional[str] = None) -> str:
         """
@@ -3,6 +3,7 @@ Devin API Client for interacting with the Devin AI API.
 """
 
 import os
+import threading
 import requests
 from typing import Dict, Any, List, Optional, Union
 import logging
@@ -35,6 +36,36 @@ class DevinAPIClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        
+        # Pool connections per thread: DevinAgent calls this client from
+        # asyncio.to_thread workers, and requests.Session is not thread-safe
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+    
+    @property
+    def http_session(self) -> requests.Session:
+        """
+        HTTP session for the calling thread, created on first use.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def close(self) -> None:
+        """
+        Close the HTTP sessions opened by this client.
+        
+        Only call this once no requests are in flight.
+        """
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
     
     def create_session(self, prompt: str, playbook_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -60,7 +91,7 @@ class DevinAPIClient:
             data["playbook_id"] = playbook_id
         
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self.http_session.post(url, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -88,7 +119,7 @@ class DevinAPIClient:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.http_session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -111,7 +142,7 @@ class DevinAPIClient:
         url = f"{self.base_url}/session/{session_id}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.http_session.get(url, headers=self.headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -139,7 +170,7 @@ class DevinAPIClient:
         }
         
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self.http_session.post(url, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -159,7 +190,7 @@ class DevinAPIClient:
         url = f"{self.base_url}/secrets"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.http_session.get(url, headers=self.headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -182,7 +213,7 @@ class DevinAPIClient:
         url = f"{self.base_url}/secrets/{secret_id}"
         
         try:
-            response = requests.delete(url, headers=self.headers)
+            response = self.http_session.delete(url, headers=self.headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -215,7 +246,7 @@ class DevinAPIClient:
                     "file": (os.path.basename(file_path), file)
                 }
                 
-                response = requests.post(url, headers=headers, files=files)
+                response = self.http_session.post(url, headers=headers, files=files)
                 response.raise_for_status()
                 return response.json()
         except FileNotFoundError:
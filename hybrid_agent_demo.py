@@ -8,26 +8,19 @@ capabilities of LangChain to solve a complex problem.
 
 import asyncio
 import logging
+import os
 from typing import Dict, List, Optional, Any
 
 from app.agent.hybrid_agent import HybridAgent, AgentRole
 from app.tool import ToolCollection, Bash, PythonExecute, Terminate
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from app.utils import BANNER, print_header
 
 
 async def run_hybrid_agent_demo() -> None:
     """
     Run a demonstration of the Hybrid Agent.
     """
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("ハイブリッドエージェントデモ (OpenAI API + LangChain)")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("ハイブリッドエージェントデモ (OpenAI API + LangChain)")
     
     # Create a tool collection
     tools = ToolCollection([
@@ -85,22 +78,18 @@ async def run_hybrid_agent_demo() -> None:
     """
     
     print(f"目標:\n{goal}\n")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
+    print(BANNER)
     
     # Run the agent
     print("\nハイブリッドエージェントを実行中...\n")
     result = await agent.run(goal)
     
     # Print the result
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("結果:")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("結果:")
     print(result)
     
     # Print the thinking processes
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("思考プロセス:")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("思考プロセス:")
     
     thinking_processes = await agent.get_thinking_processes()
     for agent_name, thinking in thinking_processes.items():
@@ -110,39 +99,39 @@ async def run_hybrid_agent_demo() -> None:
         print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
     
     # Check if the file was created
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("ファイルの確認:")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("ファイルの確認:")
     
-    import subprocess
+    output_file = "current_datetime.txt"
     try:
         # Check if the file exists
-        result = subprocess.run(
-            "ls -l current_datetime.txt 2>/dev/null || echo 'ファイルが見つかりません'",
-            shell=True,
-            capture_output=True,
-            text=True
-        )
-        print(f"ファイル情報:\n{result.stdout}")
-        
-        # Display the file contents if it exists
-        if "ファイルが見つかりません" not in result.stdout:
-            result = subprocess.run(
-                "cat current_datetime.txt",
-                shell=True,
-                capture_output=True,
-                text=True
+        if not os.path.isfile(output_file):
+            print("ファイル情報:\nファイルが見つかりません\n")
+        else:
+            # List the file without blocking the event loop or going through a shell
+            process = await asyncio.create_subprocess_exec(
+                "ls", "-l", output_file,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            print(f"\nファイルの内容:\n{result.stdout}")
+            stdout, _ = await process.communicate()
+            print(f"ファイル情報:\n{stdout.decode('utf-8')}")
+            
+            # Display the file contents
+            with open(output_file, encoding="utf-8") as f:
+                print(f"\nファイルの内容:\n{f.read()}")
     except Exception as e:
         print(f"ファイルの確認中にエラーが発生しました: {e}")
     
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("デモ完了")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("デモ完了")
     
     return "デモが正常に完了しました。"
 
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     asyncio.run(run_hybrid_agent_demo())
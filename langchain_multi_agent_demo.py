@@ -11,22 +11,14 @@ import logging
 from typing import Dict, List, Tuple
 
 from app.agent.langchain_agent import LangChainAgent, AgentProfile, MultiAgentConversation
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from app.utils import BANNER, print_header
 
 
 async def run_langchain_multi_agent_demo() -> None:
     """
     Run a demonstration of the LangChain multi-agent conversation system.
     """
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("LangChain Multi-Agent Conversation System Demo")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("LangChain Multi-Agent Conversation System Demo")
     
     # Create agent profiles with Japanese expertise
     strategist_profile = AgentProfile(
@@ -81,16 +73,14 @@ async def run_langchain_multi_agent_demo() -> None:
     """
     
     print(f"初期メッセージ:\n'{initial_message}'\n")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
+    print(BANNER)
     
     # Run the conversation
     print("\n会話を開始します...\n")
     conversation_log = await conversation.start_conversation(initial_message)
     
     # Print the conversation
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("会話ログ:")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("会話ログ:")
     
     for speaker, message in conversation_log:
         print(f"\n【{speaker}】")
@@ -98,9 +88,7 @@ async def run_langchain_multi_agent_demo() -> None:
         print("-" * 80)
     
     # Print the thinking processes
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("思考プロセス:")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("思考プロセス:")
     
     thinking_processes = await conversation.get_thinking_processes()
     for agent_name, thinking in thinking_processes.items():
@@ -110,12 +98,16 @@ async def run_langchain_multi_agent_demo() -> None:
         print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
     
     # Summary
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("デモ完了")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("デモ完了")
     
     return "デモが正常に完了しました。"
 
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     asyncio.run(run_langchain_multi_agent_demo())
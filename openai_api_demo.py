@@ -3,21 +3,52 @@ Demo script for using the GenericAgent with the new OpenAI API format.
 """
 
 import asyncio
+import fnmatch
 import json
+import os
+import time
 from typing import Dict, Any
 
 from openai import OpenAI
 
-from app.agent.generic_agent import GenericAgent
+from app.agent.generic_agent import GenericAgent, extract_text_from_response
 from app.tool import ToolCollection, Bash, PythonExecute, Terminate
+from app.utils import BANNER, print_header
+
+
+def read_recent_files(root: str, pattern: str, max_age_seconds: float) -> str:
+    """
+    Read the files under a directory whose name matches a pattern and that
+    were modified recently.
+    
+    Args:
+        root: Directory to search recursively
+        pattern: Shell-style file name pattern
+        max_age_seconds: Maximum age of a file's modification time
+        
+    Returns:
+        The concatenated contents of the matching files
+    """
+    cutoff = time.time() - max_age_seconds
+    contents = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in fnmatch.filter(filenames, pattern):
+            path = os.path.join(dirpath, filename)
+            try:
+                if os.path.isfile(path) and os.path.getmtime(path) >= cutoff:
+                    with open(path, encoding="utf-8", errors="replace") as f:
+                        contents.append(f.read())
+            except OSError:
+                continue
+    return "".join(contents)
 
 
 async def run_openai_api_demo():
     """Run a demonstration of the GenericAgent with the new OpenAI API format."""
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("OpenAI API Demo: Working Backwards Methodology")
-    print("Goal: Find the current date and time and save it to a file")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header(
+        "OpenAI API Demo: Working Backwards Methodology",
+        "Goal: Find the current date and time and save it to a file"
+    )
     
     # Create tools collection
     tools = ToolCollection([
@@ -39,9 +70,7 @@ async def run_openai_api_demo():
     await agent.set_goal(goal)
     
     # Run the agent
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("Starting Agent Execution")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("Starting Agent Execution")
     
     result = await agent.run()
     
@@ -49,19 +78,13 @@ async def run_openai_api_demo():
     status = await agent.get_execution_status()
     
     # Print the execution summary
-    print("\n◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("Execution Summary")
-    print(result)
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("Execution Summary", result)
     
-    # Format the results using the new OpenAI API format
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("Converting to OpenAI API Format")
+    print_header("Converting to OpenAI API Format")
     
     # Create a simple example of using the OpenAI API directly
     client = OpenAI()
     
-    # Create a simple example of using the OpenAI API directly
     example_response = client.responses.create(
         model="gpt-4o",
         input=[
@@ -88,35 +111,20 @@ async def run_openai_api_demo():
     )
     
     # Print the formatted response
-    response_text = ""
-    if example_response.output and len(example_response.output) > 0:
-        for output_item in example_response.output:
-            if hasattr(output_item, 'content') and output_item.content:
-                for content_item in output_item.content:
-                    if hasattr(content_item, 'text') and content_item.text:
-                        response_text += content_item.text
+    response_text = extract_text_from_response(example_response)
     
     print(f"OpenAI API Response: {response_text[:200]}...")
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print(f"{BANNER}\n")
     
     # Check for datetime files
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢")
-    print("Checking Results")
-    
-    import subprocess
     try:
-        # Use subprocess directly to find and display datetime files
-        result = subprocess.run(
-            "find /home/ubuntu -name 'date*' -type f -mmin -5 -print | xargs cat 2>/dev/null || echo 'No recent datetime files found'",
-            shell=True,
-            capture_output=True,
-            text=True
-        )
-        print(f"Datetime file contents:\n{result.stdout}")
+        # Find and display recently written datetime files
+        contents = read_recent_files("/home/ubuntu", "date*", max_age_seconds=5 * 60)
+        check_result = f"Datetime file contents:\n{contents or 'No recent datetime files found'}"
     except Exception as e:
-        print(f"Error checking results: {e}")
+        check_result = f"Error checking results: {e}"
     
-    print("◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢\n")
+    print_header("Checking Results", check_result)
     
     return "Demo completed successfully"
 